@@ -1,3 +1,4 @@
 """Utility functions for CAD Agents system."""
 
-from . import mcp_utils 
\ No newline at end of file
+from . import mcp_utils
+from . import paths 
\ No newline at end of file
@@ -1,44 +1,77 @@
 """Utilities for interacting with FreeCAD MCP server using MCPToolset."""
 
+import asyncio
 import logging
 import contextlib
 from typing import Optional, Tuple, List, Any
 
-# Need to ensure SseServerParams is imported correctly
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, SseServerParams 
+__all__ = ["MCP_SERVER_URL", "load_mcp_tools", "reset_mcp_cache", "close_mcp_connection"]
 
 logger = logging.getLogger(__name__)
 
 # Define the MCP server address (assuming SSE on port 5050)
 MCP_SERVER_URL = "http://localhost:5050/"
 
+# Open MCP connection shared by every caller in this process
+_mcp_tools: Optional[List[Any]] = None
+_mcp_exit_stack: Optional[contextlib.AsyncExitStack] = None
+# Serializes connection setup so concurrent callers share one handshake
+_mcp_lock = asyncio.Lock()
+
 async def load_mcp_tools() -> Tuple[Optional[List[Any]], Optional[contextlib.AsyncExitStack]]:
-    """Connect to the FreeCAD MCP server and retrieve its tools using MCPToolset."""
-    
-    logger.info(f"Attempting to connect to FreeCAD MCP server via SSE at {MCP_SERVER_URL}...")
-    
-    try:
-        # Parameters to connect to the existing MCP server via SSE
-        sse_params = SseServerParams(url=MCP_SERVER_URL)
-        
-        # Use ADK's MCPToolset to connect
-        tools, exit_stack = await MCPToolset.from_server(
-            connection_params=sse_params
-        )
-        
-        logger.info(f"Successfully connected to FreeCAD MCP server, got {len(tools)} tools")
-        return tools, exit_stack
-        
-    except ImportError:
-        # Reraise import error if SseServerParams wasn't found
-        logger.error("ImportError: Could not import SseServerParams. Check google-adk installation.")
-        raise
-    except Exception as e:
-        logger.error(f"Error connecting to FreeCAD MCP server at {MCP_SERVER_URL}: {e}", exc_info=True)
-        return None, None
+    """Connect to the FreeCAD MCP server and retrieve its tools using MCPToolset.
+
+    The connection is opened once per process; later calls return the same
+    tools and exit stack until it is closed with close_mcp_connection().
+    """
+    global _mcp_tools, _mcp_exit_stack
+
+    async with _mcp_lock:
+        if _mcp_tools is not None:
+            logger.debug("Reusing open FreeCAD MCP connection.")
+            return _mcp_tools, _mcp_exit_stack
+
+        logger.info(f"Attempting to connect to FreeCAD MCP server via SSE at {MCP_SERVER_URL}...")
+
+        try:
+            # Imported here so importing this module doesn't pull in the ADK stack
+            from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, SseServerParams
+
+            # Parameters to connect to the existing MCP server via SSE
+            sse_params = SseServerParams(url=MCP_SERVER_URL)
+
+            # Use ADK's MCPToolset to connect
+            tools, exit_stack = await MCPToolset.from_server(
+                connection_params=sse_params
+            )
+
+            logger.info(f"Successfully connected to FreeCAD MCP server, got {len(tools)} tools")
+            _mcp_tools, _mcp_exit_stack = tools, exit_stack
+            return tools, exit_stack
+
+        except ImportError:
+            # Reraise import error if SseServerParams wasn't found
+            logger.error("ImportError: Could not import SseServerParams. Check google-adk installation.")
+            raise
+        except Exception as e:
+            logger.error(f"Error connecting to FreeCAD MCP server at {MCP_SERVER_URL}: {e}", exc_info=True)
+            return None, None
+
+async def reset_mcp_cache():
+    """Close the shared MCP connection so the next load_mcp_tools() reconnects.
+
+    Use this to recover after the server drops the session.
+    """
+    if _mcp_exit_stack is not None:
+        await close_mcp_connection(_mcp_exit_stack)
 
 async def close_mcp_connection(exit_stack: Optional[contextlib.AsyncExitStack]):
     """Close the MCP connection using the provided exit stack."""
+    global _mcp_tools, _mcp_exit_stack
+
+    if exit_stack is not None and exit_stack is _mcp_exit_stack:
+        _mcp_tools, _mcp_exit_stack = None, None
+
     if exit_stack:
         logger.info("Closing MCP connection...")
         try:
@@ -48,13 +81,3 @@ async def close_mcp_connection(exit_stack: Optional[contextlib.AsyncExitStack]):
             logger.error(f"Error closing MCP connection: {e}", exc_info=True)
     else:
         logger.warning("Attempted to close MCP connection, but no exit stack was provided.")
-
-# Remove previous XML-RPC client logic
-
-# --- Remove or keep legacy functions as needed, currently commented out ---
-
-# def setup_mcp_environment(): ... # Likely not needed for XML-RPC
-# async def _initialize_mcp_toolset(): ... # Removed
-# async def get_mcp_tool_proxy(tool_name: str): ... # Removed
-# def get_mcp_client(): ... # Removed
-# def check_mcp_connection(): ... # Removed 
\ No newline at end of file
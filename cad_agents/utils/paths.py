@@ -0,0 +1,21 @@
+"""Filesystem locations shared by the CAD Agents scripts."""
+
+import functools
+from pathlib import Path
+from typing import Optional
+
+__all__ = ["FREECAD_MCP_DIR", "freecad_mcp_root"]
+
+# Repository root: cad_agents/utils/paths.py -> cad_agents/utils -> cad_agents -> root
+_ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Expected location of the freecad-mcp submodule
+FREECAD_MCP_DIR = _ROOT_DIR / "freecad-mcp"
+
+@functools.lru_cache(maxsize=1)
+def freecad_mcp_root() -> Optional[Path]:
+    """Return the freecad-mcp submodule directory, or None if it is missing.
+
+    The directory is only checked once per process.
+    """
+    return FREECAD_MCP_DIR if FREECAD_MCP_DIR.is_dir() else None
@@ -2,11 +2,12 @@
 """Check prerequisites for CAD Agents system."""
 
 import sys
+import importlib.metadata
+import importlib.util
 import logging
 import platform
-import subprocess
-import os
-from pathlib import Path
+
+from cad_agents.utils.paths import FREECAD_MCP_DIR, freecad_mcp_root
 
 # Configure logging
 logging.basicConfig(
@@ -16,17 +17,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_python_version():
-    """Check if Python version is 3.10 or higher."""
-    python_version = sys.version_info
-    logger.info(f"Current Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
-    
-    if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 10):
-        logger.error("❌ Python 3.10 or higher is required for this project")
-        logger.info("\nInstallation instructions for Python 3.10 or higher:")
-        
-        if platform.system() == "Darwin":  # macOS
-            logger.info("""
+_MAC_HELP = """
 On macOS:
 1. Using Homebrew (recommended):
    $ brew install python@3.10
@@ -38,9 +29,9 @@ After installation, create a new virtual environment using Python 3.10:
    $ /path/to/python3.10 -m venv .venv
    $ source .venv/bin/activate
    $ pip install -e .
-""")
-        elif platform.system() == "Linux":
-            logger.info("""
+"""
+
+_LINUX_HELP = """
 On Linux:
 1. Ubuntu/Debian:
    $ sudo apt update
@@ -58,9 +49,9 @@ After installation, create a new virtual environment using Python 3.10:
    $ python3.10 -m venv .venv
    $ source .venv/bin/activate
    $ pip install -e .
-""")
-        elif platform.system() == "Windows":
-            logger.info("""
+"""
+
+_WIN_HELP = """
 On Windows:
 1. Using the official installer (recommended):
    Download from https://www.python.org/downloads/
@@ -72,7 +63,23 @@ After installation, create a new virtual environment using Python 3.10:
    $ py -3.10 -m venv .venv
    $ .venv\\Scripts\\activate
    $ pip install -e .
-""")
+"""
+
+# Python installation hints keyed by platform.system()
+_INSTALL_HINTS = {"Darwin": _MAC_HELP, "Linux": _LINUX_HELP, "Windows": _WIN_HELP}
+
+def check_python_version():
+    """Check if Python version is 3.10 or higher."""
+    python_version = sys.version_info
+    logger.info(f"Current Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+    
+    if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 10):
+        logger.error("❌ Python 3.10 or higher is required for this project")
+        logger.info("\nInstallation instructions for Python 3.10 or higher:")
+        
+        install_hint = _INSTALL_HINTS.get(platform.system())
+        if install_hint:
+            logger.info(install_hint)
         
         return False
     else:
@@ -81,11 +88,8 @@ After installation, create a new virtual environment using Python 3.10:
 
 def check_freecad_mcp():
     """Check if FreeCAD MCP submodule is available."""
-    root_dir = Path(__file__).parent
-    mcp_dir = root_dir / "freecad-mcp"
-    
-    if not mcp_dir.exists():
-        logger.error("❌ FreeCAD MCP directory not found at %s", mcp_dir)
+    if freecad_mcp_root() is None:
+        logger.error("❌ FreeCAD MCP directory not found at %s", FREECAD_MCP_DIR)
         logger.info("""
 To clone the freecad-mcp submodule:
    $ git submodule update --init --recursive
@@ -97,21 +101,22 @@ To clone the freecad-mcp submodule:
 
 def check_mcp_package():
     """Check if MCP package is installed."""
-    try:
-        import mcp
-        logger.info(f"✅ MCP package is installed (version {mcp.__version__})")
-        return True
-    except ImportError:
+    # Locate the package without importing it
+    if importlib.util.find_spec("mcp") is None:
         logger.error("❌ MCP package is not installed")
         logger.info("""
 To install the MCP package:
    $ pip install mcp>=0.3.0
 """)
         return False
-    except AttributeError:
-        # If __version__ is not available
+    
+    try:
+        # Read the version from the distribution metadata
+        logger.info(f"✅ MCP package is installed (version {importlib.metadata.version('mcp')})")
+    except importlib.metadata.PackageNotFoundError:
+        # If the package has no distribution metadata
         logger.info("✅ MCP package is installed (version unknown)")
-        return True
+    return True
 
 def main():
     """Run all checks."""
@@ -122,13 +127,9 @@ def main():
         logger.error("\n❌ Prerequisites check failed - Python version requirement not met")
         return False
     
+    # Run the checks in order so each one's error and install hint stay together
     freecad_mcp_check = check_freecad_mcp()
-    
-    if python_check:
-        # Only check for MCP package if Python version is correct
-        mcp_check = check_mcp_package()
-    else:
-        mcp_check = False
+    mcp_check = check_mcp_package()
     
     if python_check and freecad_mcp_check and mcp_check:
         logger.info("\n✅ All prerequisites met!")
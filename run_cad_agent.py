@@ -5,12 +5,6 @@ import logging
 import sys
 from dotenv import load_dotenv
 
-from google.genai import types as genai_types
-from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.adk.artifacts import InMemoryArtifactService # Optional, but good practice
-
 from cad_agents.utils.mcp_utils import load_mcp_tools, close_mcp_connection
 
 # Configure basic logging
@@ -30,6 +24,8 @@ async def get_agent_and_stack():
         return None, None
 
     logger.info(f"Fetched {len(tools)} tools from MCP server.")
+
+    from google.adk.agents import LlmAgent
     
     # Define the agent that will use the MCP tools
     # Using the last model specified by the user
@@ -52,7 +48,13 @@ async def async_main():
         return
 
     # Ensure the MCP connection is closed when done
-    async with exit_stack:
+    try:
+        # ADK is only imported once the agent exists, keeping failed startups cheap
+        from google.genai import types as genai_types
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+        from google.adk.artifacts import InMemoryArtifactService # Optional, but good practice
+
         session_service = InMemorySessionService()
         artifacts_service = InMemoryArtifactService() # Optional
 
@@ -84,16 +86,19 @@ async def async_main():
                 )
                 
                 final_response = ""
+                write = sys.stdout.write
                 async for event in events_async:
                     logger.debug(f"Event received: {event}")
-                    if event.content and event.content.parts:
+                    parts = event.content.parts if event.content else None
+                    if parts:
                          # Check for text parts specifically for printing
-                         text_parts = [part.text for part in event.content.parts if hasattr(part, 'text') and part.text]
-                         if text_parts:
-                             response_chunk = "".join(text_parts)
-                             print(f"[{event.author}]: {response_chunk}")
-                             if event.type == 'FINAL_RESPONSE': # Accumulate final response
+                         response_chunk = "".join(text for part in parts if (text := getattr(part, 'text', None)))
+                         if response_chunk:
+                             write(f"[{event.author}]: {response_chunk}\n")
+                             if event.is_final_response(): # Accumulate final response
                                  final_response += response_chunk
+                # Flush once per turn rather than once per event
+                sys.stdout.flush()
                 
                 # If no text was printed in the final response event, indicate completion
                 # if final_response:
@@ -106,6 +111,8 @@ async def async_main():
                 logger.error(f"An error occurred during the run loop: {e}", exc_info=True)
                 # Decide whether to break or continue on error
                 break 
+    finally:
+        await close_mcp_connection(exit_stack)
 
     logger.info("Agent session finished.")
 
@@ -113,11 +120,6 @@ async def async_main():
 if __name__ == '__main__':
     try:
         asyncio.run(async_main())
-    except ImportError:
-         # Specific handling for the SseServerParams import error during testing
-        logger.error("ImportError occurred. Could not import SseServerParams from google.adk.tools.mcp_tool.mcp_toolset.")
-        logger.error("Please ensure 'google-adk' is installed correctly and the class exists.")
-        sys.exit(1)
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         sys.exit(1)
@@ -0,0 +1,79 @@
+"""Shared FreeCAD process detection for the test scripts."""
+
+import asyncio
+import logging
+import subprocess
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_PROC_DIR = Path('/proc')
+
+def _scan_proc():
+    """Look for a FreeCAD process name in /proc/<pid>/comm (Linux)."""
+    for entry in _PROC_DIR.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            if 'freecad' in (entry / 'comm').read_text().lower():
+                return True
+        except OSError:
+            # The process exited or is not readable
+            continue
+    return False
+
+def _scan_psutil():
+    """Look for a FreeCAD process name with psutil, or return None if it isn't installed."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return any(
+        'freecad' in (proc.info['name'] or '').lower()
+        for proc in psutil.process_iter(['name'])
+    )
+
+# How long a probe result is reused, in seconds
+_CACHE_TTL = 2.0
+# Last probe result and the time.monotonic() timestamp it was taken at
+_cached_running = None
+_cached_at = 0.0
+
+def check_is_freecad_running():
+    """Check if FreeCAD is running.
+
+    A result is reused for _CACHE_TTL seconds, so repeated checks share one scan
+    while a FreeCAD started later in the run is still noticed.
+    """
+    global _cached_running, _cached_at
+    now = time.monotonic()
+    if _cached_running is not None and now - _cached_at < _CACHE_TTL:
+        return _cached_running
+    
+    _cached_running = _scan_processes()
+    _cached_at = now
+    return _cached_running
+
+def _scan_processes():
+    """Scan the process list once for FreeCAD."""
+    try:
+        if _PROC_DIR.is_dir():
+            return _scan_proc()
+        running = _scan_psutil()
+        if running is not None:
+            return running
+        # No /proc and no psutil (e.g. macOS without extras): ask pgrep, which
+        # matches process names itself instead of dumping the whole table
+        result = subprocess.run(['pgrep', '-i', 'freecad'], stdout=subprocess.DEVNULL)
+        return result.returncode == 0
+    except Exception as e:
+        logger.error("Error checking if FreeCAD is running: %s", e)
+        return False
+
+async def check_is_freecad_running_async():
+    """Check if FreeCAD is running without blocking the event loop.
+
+    Shares the cached result with check_is_freecad_running().
+    """
+    return await asyncio.to_thread(check_is_freecad_running)
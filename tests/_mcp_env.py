@@ -0,0 +1,55 @@
+"""Shared freecad-mcp import path setup for the test scripts."""
+
+import asyncio
+import atexit
+import functools
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Add the project root to the Python path so cad_agents is importable
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from cad_agents.utils.paths import FREECAD_MCP_DIR
+
+# freecad-mcp source directory inside the submodule located by cad_agents.utils.paths
+MCP_SRC_DIR = str(FREECAD_MCP_DIR / "src")
+
+@functools.lru_cache(maxsize=None)
+def _add_mcp_src_dir(mcp_src_dir):
+    """Add mcp_src_dir to sys.path, once per directory; return whether it exists."""
+    if not os.path.isdir(mcp_src_dir):
+        logger.error("Error: FreeCAD MCP source directory not found at %s", mcp_src_dir)
+        return False
+    
+    if mcp_src_dir not in sys.path:
+        sys.path.append(mcp_src_dir)
+    logger.info("Added %s to Python path", mcp_src_dir)
+    return True
+
+# Add the freecad-mcp submodule to the Python path
+def setup_mcp_environment(mcp_src_dir=MCP_SRC_DIR):
+    """Set up the environment to use FreeCAD MCP.
+
+    The directory check and sys.path scan only run on the first call for a given path.
+    """
+    return _add_mcp_src_dir(mcp_src_dir)
+
+@functools.lru_cache(maxsize=1)
+def _shared_loop():
+    """Return the event loop shared by the MCP tests, created on first use."""
+    loop = asyncio.new_event_loop()
+    atexit.register(loop.close)
+    return loop
+
+def run_async(coro):
+    """Run coro to completion on the shared event loop.
+
+    Unlike asyncio.run, repeated calls reuse one loop instead of building and
+    tearing down a new one each time.
+    """
+    return _shared_loop().run_until_complete(coro)
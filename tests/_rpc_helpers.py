@@ -0,0 +1,116 @@
+"""Shared XML-RPC client helpers for the FreeCAD test scripts."""
+
+import functools
+import json
+import logging
+import socket
+import textwrap
+import xmlrpc.client
+
+from _freecad_probe import check_is_freecad_running
+
+logger = logging.getLogger(__name__)
+
+# Address of the FreeCAD addon's RPC server
+RPC_HOST = "localhost"
+RPC_PORT = 9876
+RPC_URL = f"http://{RPC_HOST}:{RPC_PORT}"
+
+class KeepAliveTransport(xmlrpc.client.Transport):
+    """Transport that asks the server to keep the connection open between calls.
+
+    The stdlib Transport already holds on to its HTTPConnection; the explicit
+    Connection header stops servers that default to closing from dropping it.
+    """
+
+    def send_headers(self, connection, headers):
+        super().send_headers(connection, [*headers, ("Connection", "keep-alive")])
+
+def probe_rpc_port(timeout=5.0):
+    """Check that the RPC server accepts TCP connections, raising OSError if not.
+
+    One connect attempt fails fast when nothing is listening, without going
+    through an XML-RPC request first.
+    """
+    socket.create_connection((RPC_HOST, RPC_PORT), timeout=timeout).close()
+
+def make_rpc_proxy(url=RPC_URL):
+    """Return a ServerProxy for the FreeCAD RPC server that reuses one connection."""
+    return xmlrpc.client.ServerProxy(url, transport=KeepAliveTransport(), allow_none=True)
+
+@functools.lru_cache(maxsize=1)
+def get_rpc_proxy():
+    """Return the ServerProxy shared by every test in this process.
+
+    Test modules run in one session share its keep-alive connection instead of
+    each opening their own.
+    """
+    return make_rpc_proxy()
+
+def test_freecad_rpc_connection():
+    """Test connection to the FreeCAD RPC server on port 9876.
+
+    Returns the shared proxy on success, None if the server can't be reached and
+    False if FreeCAD is not running.
+    """
+    if not check_is_freecad_running():
+        logger.warning("FreeCAD is not running. Please start FreeCAD.")
+        return False
+    
+    try:
+        # Try to connect to the FreeCAD RPC server
+        logger.info("Connecting to FreeCAD RPC server on port %d...", RPC_PORT)
+        probe_rpc_port()
+        rpc_server = get_rpc_proxy()
+        
+        # Test the connection with a simple ping
+        result = rpc_server.ping()
+        if result:
+            logger.info("✅ Successfully connected to FreeCAD RPC server on port %d", RPC_PORT)
+            return rpc_server
+        else:
+            logger.error("Failed to ping FreeCAD RPC server")
+            return None
+    except Exception as e:
+        logger.error("Error connecting to FreeCAD RPC server: %s", e)
+        logger.info("Make sure the RPC server is started in FreeCAD:")
+        logger.info("1. In FreeCAD, select the 'MCP Addon' workbench")
+        logger.info("2. Click the 'Start RPC Server' button in the toolbar")
+        return None
+
+# Marker printed before the stage errors of a combined FreeCAD script
+STAGE_ERRORS_MARKER = "STAGE_ERRORS:"
+
+def build_staged_script(body, stages):
+    """Return a FreeCAD script that runs body, then each stage function it defines.
+
+    stages names the stages in run order; each name refers to a _<name>_stage()
+    function in body. A failing stage is recorded instead of aborting the rest,
+    and the errors are printed for parse_stage_errors().
+    """
+    stage_list = ", ".join(f"({name!r}, _{name}_stage)" for name in stages)
+    runner = textwrap.dedent(f"""
+        import json as _json
+
+        _stage_errors = {{}}
+        for _name, _stage in ({stage_list},):
+            try:
+                _stage()
+            except Exception as e:
+                _stage_errors[_name] = str(e)
+
+        print({STAGE_ERRORS_MARKER!r} + _json.dumps(_stage_errors))
+    """).strip()
+    return textwrap.dedent(body).strip() + "\n\n" + runner
+
+def parse_marked_json(message, marker):
+    """Return the JSON printed after marker by a FreeCAD script, or None if absent."""
+    # The marker may share a line with the server's "Output: " prefix
+    _, found, payload = message.rpartition(marker)
+    if not found:
+        return None
+    return json.loads(payload.splitlines()[0])
+
+def parse_stage_errors(message):
+    """Return the stage errors printed by a combined FreeCAD script, or None if absent."""
+    return parse_marked_json(message, STAGE_ERRORS_MARKER)
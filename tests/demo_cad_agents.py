@@ -19,6 +19,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Load environment variables once at import
+load_dotenv()
+
 # Add the project root to the Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(project_root)
@@ -27,25 +30,35 @@ if parent_dir not in sys.path:
 
 # Import CAD Agents modules
 from cad_agents.agents.root_agent import root_agent
-from cad_agents.utils.mcp_utils import get_mcp_tools_async
+from cad_agents.utils.mcp_utils import load_mcp_tools, close_mcp_connection
 
 async def check_mcp_connection_async():
     """Check MCP connection using the async ADK MCPToolset method."""
     logger.info("Checking MCP connection using ADK MCPToolset...")
-    tools, exit_stack = await get_mcp_tools_async()
+    tools, exit_stack = await load_mcp_tools()
     if tools and exit_stack:
         logger.info(f"Successfully connected to FreeCAD MCP server. Found {len(tools)} tools.")
-        await exit_stack.aclose() # Ensure connection is closed
+        await close_mcp_connection(exit_stack)  # Ensure connection is closed
         return True
     else:
         logger.warning("Could not connect to FreeCAD MCP server via ADK MCPToolset.")
         return False
 
+def _print_events(events):
+    """Print the text of each agent event that carries any."""
+    for event in events:
+        content = event.content
+        if content is None:
+            continue
+        parts = content.parts
+        if not parts:
+            continue
+        text = parts[0].text
+        if text:
+            print(f"Agent: {text}")
+
 async def run_demo():
     """Run the CAD Agents demonstration."""
-    # Load environment variables
-    load_dotenv()
-    
     # Check MCP connection using the async method
     if not await check_mcp_connection_async():
         logger.error("Failed to connect to FreeCAD MCP server. Make sure FreeCAD is running with the MCP server enabled.")
@@ -69,10 +82,9 @@ async def run_demo():
         response = await session.send_message(
             Message.user("Create a new document named 'RocketDemo'")
         )
+        _print_events(response.events)
         # Check response for success/failure if possible, or just proceed
         for event in response.events:
-             if event.content and event.content.parts:
-                 print(f"Agent: {event.content.parts[0].text}")
              # Look for tool result if needed
              if isinstance(event, FunctionResponse) and event.name == 'execute_code':
                  if 'error' in event.response:
@@ -90,9 +102,7 @@ async def run_demo():
             Message.user("Using the current document 'RocketDemo', I want to create a simple rocket model. "
                          "Start with a cylinder for the body, a cone for the nose, and some fins at the bottom.")
         )
-        for event in response.events:
-            if event.content and event.content.parts:
-                print(f"Agent: {event.content.parts[0].text}")
+        _print_events(response.events)
         
         # Step 2: Modify the model dimensions
         logger.info("Step 2: Modifying the model dimensions...")
@@ -100,36 +110,28 @@ async def run_demo():
             Message.user("Make the rocket body 50mm tall with a radius of 10mm. "
                          "The nose cone should be 20mm tall. Add three triangular fins.")
         )
-        for event in response.events:
-            if event.content and event.content.parts:
-                print(f"Agent: {event.content.parts[0].text}")
+        _print_events(response.events)
         
         # Step 3: Analyze the model
         logger.info("Step 3: Analyzing the model...")
         response = await session.send_message(
             Message.user("Can you analyze this rocket model and tell me its volume and center of mass?")
         )
-        for event in response.events:
-            if event.content and event.content.parts:
-                print(f"Agent: {event.content.parts[0].text}")
+        _print_events(response.events)
         
         # Step 4: Make improvements based on analysis
         logger.info("Step 4: Improving the model...")
         response = await session.send_message(
             Message.user("Suggest some improvements to this rocket design for better stability.")
         )
-        for event in response.events:
-            if event.content and event.content.parts:
-                print(f"Agent: {event.content.parts[0].text}")
+        _print_events(response.events)
         
         # Step 5: Save the model
         logger.info("Step 5: Saving the model...")
         response = await session.send_message(
             Message.user("Save this rocket model as 'rocket_design.FCStd'.")
         )
-        for event in response.events:
-            if event.content and event.content.parts:
-                print(f"Agent: {event.content.parts[0].text}")
+        _print_events(response.events)
         
         logger.info("Demo completed successfully!")
         return True
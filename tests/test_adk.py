@@ -16,6 +16,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Load environment variables once at import
+load_dotenv()
+
 # Add the project root to the Python path
 project_root = Path(__file__).parent
 if str(project_root) not in sys.path:
@@ -29,17 +32,15 @@ async def test_adk_setup():
     """Test the ADK setup by checking model capabilities and MCP connection."""
     logger.info("Testing ADK setup with model: %s", root_agent.model)
     
-    # Load environment variables
-    load_dotenv()
-    
     # 1. Check environment variables
     logger.info("Checking environment variables...")
     if os.getenv("GOOGLE_GENAI_USE_VERTEXAI") == "True":
-        if not os.getenv("GOOGLE_CLOUD_PROJECT") or not os.getenv("GOOGLE_CLOUD_LOCATION"):
+        project = os.getenv("GOOGLE_CLOUD_PROJECT")
+        location = os.getenv("GOOGLE_CLOUD_LOCATION")
+        if not project or not location:
             logger.error("GOOGLE_CLOUD_PROJECT and GOOGLE_CLOUD_LOCATION must be set when using Vertex AI")
             return False
-        logger.info("Using Vertex AI with project: %s, location: %s", 
-                   os.getenv("GOOGLE_CLOUD_PROJECT"), os.getenv("GOOGLE_CLOUD_LOCATION"))
+        logger.info("Using Vertex AI with project: %s, location: %s", project, location)
     else:
         if not os.getenv("GOOGLE_API_KEY"):
             logger.error("GOOGLE_API_KEY must be set when not using Vertex AI")
@@ -3,9 +3,9 @@
 
 import os
 import sys
+import functools
 import logging
 import asyncio
-from pathlib import Path
 from dotenv import load_dotenv
 
 # Configure logging
@@ -16,58 +16,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Add the freecad-mcp submodule to the Python path
-def setup_mcp_environment():
-    """Set up the environment to use FreeCAD MCP."""
-    # Get the project root directory
-    root_dir = Path(__file__).parent.parent  # Changed to parent.parent to get the main project directory
-    mcp_src_dir = root_dir / "freecad-mcp" / "src"
-    
-    if mcp_src_dir.exists():
-        if str(mcp_src_dir) not in sys.path:
-            sys.path.append(str(mcp_src_dir))
-        logger.info(f"Added {mcp_src_dir} to Python path")
-        return True
-    else:
-        logger.error(f"Error: FreeCAD MCP source directory not found at {mcp_src_dir}")
-        return False
+# Load environment variables once at import; .env holds plain values, so skip interpolation
+load_dotenv(override=False, interpolate=False)
+
+from _freecad_probe import check_is_freecad_running_async
+from _mcp_env import MCP_SRC_DIR as _MCP_SRC_DIR, run_async, setup_mcp_environment
+
+# Environment for the stdio MCP server, built once per process
+_MCP_ENV = {
+    "PYTHONPATH": os.pathsep.join(filter(None, [_MCP_SRC_DIR, os.environ.get("PYTHONPATH", "")]))
+}
+
+# Full environment for the spawned server subprocess, built once per process
+_BASE_ENV = {**os.environ, **_MCP_ENV}
+
+@functools.lru_cache(maxsize=1)
+def _server_params():
+    """Return the stdio parameters for the FreeCAD MCP server, built on first use.
+
+    The ADK import is deferred until a test actually connects.
+    """
+    from google.adk.tools.mcp_tool.mcp_toolset import StdioServerParameters
+    return StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "freecad_mcp.server"],
+        env=_MCP_ENV
+    )
 
 async def run_freecad_mcp_server():
     """Run the FreeCAD MCP server as a subprocess."""
     try:
-        # Get the absolute path to the freecad-mcp module
-        root_dir = Path(__file__).parent.parent  # Changed to parent.parent
-        mcp_src_dir = root_dir / "freecad-mcp" / "src"
-        
-        if not mcp_src_dir.exists():
-            logger.error(f"FreeCAD MCP source directory not found at {mcp_src_dir}")
+        # Reuses the cached check on _MCP_SRC_DIR, which _BASE_ENV already points at
+        if not setup_mcp_environment():
             return None
         
-        # Set up environment variables
-        env = os.environ.copy()
-        env["PYTHONPATH"] = f"{str(mcp_src_dir)}:{env.get('PYTHONPATH', '')}"
-        
         # Start the FreeCAD MCP server
         logger.info("Starting the FreeCAD MCP server...")
+        # stdin is the stdio server's transport: keep it open as a pipe, or the
+        # server reads EOF and exits. Nothing reads its output, so don't leave
+        # pipes to fill up; keep stderr on the console when debugging
         process = await asyncio.create_subprocess_exec(
             sys.executable, "-m", "freecad_mcp.server",
             stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=None if logger.isEnabledFor(logging.DEBUG) else asyncio.subprocess.DEVNULL,
+            env=_BASE_ENV
         )
         
-        logger.info(f"FreeCAD MCP server started with PID {process.pid}")
+        logger.info("FreeCAD MCP server started with PID %s", process.pid)
         return process
     except Exception as e:
-        logger.error(f"Error starting FreeCAD MCP server: {e}")
+        logger.error("Error starting FreeCAD MCP server: %s", e)
         return None
 
 async def test_adk_with_freecad():
     """Test the Google ADK with FreeCAD MCP."""
-    # Load environment variables
-    load_dotenv()
-    
     # Set up MCP environment
     if not setup_mcp_environment():
         logger.error("Failed to set up MCP environment")
@@ -87,36 +90,31 @@ async def test_adk_with_freecad():
         logger.info("Using Google AI Studio with API key")
     
     try:
-        # Start the FreeCAD MCP server
-        server_process = await run_freecad_mcp_server()
+        # Start the FreeCAD MCP server while checking for a running FreeCAD
+        freecad_running, server_process = await asyncio.gather(
+            check_is_freecad_running_async(),
+            run_freecad_mcp_server(),
+        )
+        if not freecad_running:
+            logger.warning("FreeCAD is not running; the MCP server's tools will not be able to reach it.")
         if not server_process:
             logger.error("Failed to start FreeCAD MCP server")
             return False
         
         try:
             # Import Google ADK modules
-            from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
+            from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
             
             # Connect to the FreeCAD MCP server using ADK's MCPToolset
             logger.info("Connecting to FreeCAD MCP server using ADK's MCPToolset...")
             
-            # Get the absolute path to the freecad-mcp module
-            root_dir = Path(__file__).parent.parent  # Changed to parent.parent
-            mcp_src_dir = root_dir / "freecad-mcp" / "src"
-            
-            # Set up server parameters
-            server_params = StdioServerParameters(
-                command=sys.executable,
-                args=["-m", "freecad_mcp.server"],
-                env={"PYTHONPATH": f"{str(mcp_src_dir)}:{os.getenv('PYTHONPATH', '')}"}
-            )
-            
             # Connect to the server
-            tools, exit_stack = await MCPToolset.from_server(connection_params=server_params)
+            tools, exit_stack = await MCPToolset.from_server(connection_params=_server_params())
             
             if tools and exit_stack:
-                tool_names = [tool.name for tool in tools]
-                logger.info(f"Successfully connected to FreeCAD MCP server. Found tools: {tool_names}")
+                logger.info("Successfully connected to FreeCAD MCP server. Found %s tools.", len(tools))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Tools: %s", [tool.name for tool in tools])
                 
                 # Make sure we clean up properly
                 await exit_stack.aclose()
@@ -126,21 +124,21 @@ async def test_adk_with_freecad():
                 logger.warning("Could not connect to FreeCAD MCP server. Make sure it's running.")
                 return False
         except Exception as e:
-            logger.error(f"Error testing MCP connection: {e}")
+            logger.error("Error testing MCP connection: %s", e)
             return False
         finally:
             # Terminate the server process
-            if server_process:
+            if server_process.returncode is None:
                 server_process.terminate()
                 await server_process.wait()
-                logger.info("FreeCAD MCP server stopped")
+            logger.info("FreeCAD MCP server stopped")
     except Exception as e:
-        logger.error(f"Error in test_adk_with_freecad: {e}")
+        logger.error("Error in test_adk_with_freecad: %s", e)
         return False
 
 if __name__ == "__main__":
     try:
-        result = asyncio.run(test_adk_with_freecad())
+        result = run_async(test_adk_with_freecad())
         if result:
             logger.info("✅ Test passed! Google ADK can successfully use the FreeCAD-MCP server.")
             sys.exit(0)
@@ -148,5 +146,5 @@ if __name__ == "__main__":
             logger.error("❌ Test failed. Check the logs above for details.")
             sys.exit(1)
     except Exception as e:
-        logger.error(f"Error running test: {e}")
+        logger.error("Error running test: %s", e)
         sys.exit(1) 
\ No newline at end of file
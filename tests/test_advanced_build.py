@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """Advanced test script to explore FreeCAD's capabilities through the RPC interface."""
 
+import os
 import sys
 import logging
 import time
 import xmlrpc.client
-import subprocess
-import json
 from pathlib import Path
 
 # Configure logging
@@ -17,71 +16,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_is_freecad_running():
-    """Check if FreeCAD is running."""
-    try:
-        # Use ps aux to check if FreeCAD is running
-        result = subprocess.run(['ps', 'aux'], stdout=subprocess.PIPE, text=True)
-        return 'freecad' in result.stdout.lower()
-    except Exception as e:
-        logger.error(f"Error checking if FreeCAD is running: {e}")
-        return False
+from _rpc_helpers import build_staged_script, parse_stage_errors, test_freecad_rpc_connection
 
-def test_freecad_rpc_connection():
-    """Test connection to the FreeCAD RPC server on port 9876."""
-    if not check_is_freecad_running():
-        logger.warning("FreeCAD is not running. Please start FreeCAD.")
-        return False
-    
-    try:
-        # Try to connect to the FreeCAD RPC server
-        logger.info("Connecting to FreeCAD RPC server on port 9876...")
-        rpc_server = xmlrpc.client.ServerProxy("http://localhost:9876", allow_none=True)
-        
-        # Test the connection with a simple ping
-        result = rpc_server.ping()
-        if result:
-            logger.info("✅ Successfully connected to FreeCAD RPC server on port 9876")
-            return rpc_server
-        else:
-            logger.error("Failed to ping FreeCAD RPC server")
-            return None
-    except Exception as e:
-        logger.error(f"Error connecting to FreeCAD RPC server: {e}")
-        logger.info("Make sure the RPC server is started in FreeCAD:")
-        logger.info("1. In FreeCAD, select the 'MCP Addon' workbench")
-        logger.info("2. Click the 'Start RPC Server' button in the toolbar")
-        return None
+# Cut, fusion, fillet and polar pattern stages, run server-side in one execute_code call
+COMPLEX_MODEL_CODE = build_staged_script("""
+    import FreeCAD
+    import Draft
+    doc = FreeCAD.getDocument("ComplexTest")
 
-def execute_freecad_code(rpc_server, code):
-    """Execute arbitrary Python code in FreeCAD."""
-    try:
-        logger.info(f"Executing code: {code.strip()}")
-        result = rpc_server.execute_code(code)
-        if result["success"]:
-            logger.info("Code execution successful")
-            return True
-        else:
-            logger.error(f"Code execution failed: {result.get('error', 'Unknown error')}")
-            return False
-    except Exception as e:
-        logger.error(f"Error executing code: {e}")
-        return False
+    def _cut_stage():
+        # Cut operation (cylinder - box)
+        cut = doc.addObject("Part::Cut", "CylinderCut")
+        cut.Base = doc.BaseCylinder
+        cut.Tool = doc.CuttingBox
+        cut.ViewObject.ShapeColor = (0.8, 0.5, 0.2, 1.0) # Orange
+        doc.recompute()
+
+    def _fusion_stage():
+        # Fusion operation (cut result + sphere)
+        fusion = doc.addObject("Part::Fuse", "FinalShape")
+        fusion.Base = doc.CylinderCut
+        fusion.Tool = doc.AdditiveSphere
+        fusion.ViewObject.ShapeColor = (0.8, 0.8, 0.0, 1.0) # Yellow
+        doc.recompute()
+
+    def _fillet_stage():
+        # Create a fillet on the final shape
+        fillet = doc.addObject("Part::Fillet", "FilletedShape")
+        fillet.Base = doc.FinalShape
+
+        # Fillet every edge; only the count is needed, not the edge objects
+        edge_count = len(doc.FinalShape.Shape.Edges)
+        edges = [(i, 3.0, 3.0) for i in range(1, edge_count + 1)]  # (edge_index, radius1, radius2)
+
+        fillet.Edges = edges
+        doc.recompute()
+
+        # Hide original objects
+        doc.BaseCylinder.ViewObject.Visibility = False
+        doc.CuttingBox.ViewObject.Visibility = False
+        doc.AdditiveSphere.ViewObject.Visibility = False
+        doc.CylinderCut.ViewObject.Visibility = False
+        doc.FinalShape.ViewObject.Visibility = False
+
+        # Set the fillet color
+        fillet.ViewObject.ShapeColor = (0.9, 0.5, 0.9, 1.0)  # Purple
+
+    def _pattern_stage():
+        # Create a small cylinder to be patterned
+        small_cyl = doc.addObject("Part::Cylinder", "PatternBase")
+        small_cyl.Radius = 3.0
+        small_cyl.Height = 10.0
+        small_cyl.Placement = FreeCAD.Placement(
+            FreeCAD.Vector(40, 0, 0),
+            FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
+        )
+        small_cyl.ViewObject.ShapeColor = (1.0, 0.0, 0.0, 1.0)  # Pure red
+
+        doc.recompute()
+
+        # Create a circular pattern with 8 instances around the Z axis. The
+        # link array shares the base shape, so the copies keep its red color.
+        pattern = Draft.make_polar_array(
+            small_cyl, number=8, angle=360.0, center=FreeCAD.Vector(0, 0, 0), use_link=True
+        )
+        pattern.Label = "PolarPattern"
+        doc.recompute()
+
+        # Hide the original
+        small_cyl.ViewObject.Visibility = False
+""", ("cut", "fusion", "fillet", "pattern"))
 
 def create_complex_model(rpc_server):
     """Create a more complex model in FreeCAD with boolean operations and styling."""
     try:
-        # Create a new document
-        logger.info("Creating a new document...")
-        doc_result = rpc_server.create_document("ComplexTest")
-        if not doc_result["success"]:
-            logger.error(f"Failed to create document: {doc_result.get('error', 'Unknown error')}")
-            return False
-        
-        logger.info(f"Document '{doc_result['document_name']}' created successfully.")
-        
-        # Create a base cylinder
-        logger.info("Creating base cylinder...")
+        # Base cylinder
         base_cylinder_data = {
             "Name": "BaseCylinder",
             "Type": "Part::Cylinder",
@@ -98,15 +107,7 @@ def create_complex_model(rpc_server):
             }
         }
         
-        base_result = rpc_server.create_object("ComplexTest", base_cylinder_data)
-        if not base_result["success"]:
-            logger.error(f"Failed to create base cylinder: {base_result.get('error', 'Unknown error')}")
-            return False
-        
-        logger.info(f"Base cylinder '{base_result['object_name']}' created successfully.")
-        
-        # Create a cutting box
-        logger.info("Creating cutting box...")
+        # Cutting box
         cutting_box_data = {
             "Name": "CuttingBox",
             "Type": "Part::Box",
@@ -124,15 +125,7 @@ def create_complex_model(rpc_server):
             }
         }
         
-        cutting_result = rpc_server.create_object("ComplexTest", cutting_box_data)
-        if not cutting_result["success"]:
-            logger.error(f"Failed to create cutting box: {cutting_result.get('error', 'Unknown error')}")
-            return False
-        
-        logger.info(f"Cutting box '{cutting_result['object_name']}' created successfully.")
-        
-        # Create a sphere to be fused to the base
-        logger.info("Creating sphere...")
+        # Sphere to be fused to the base
         sphere_data = {
             "Name": "AdditiveSphere",
             "Type": "Part::Sphere",
@@ -148,152 +141,106 @@ def create_complex_model(rpc_server):
             }
         }
         
-        sphere_result = rpc_server.create_object("ComplexTest", sphere_data)
-        if not sphere_result["success"]:
-            logger.error(f"Failed to create sphere: {sphere_result.get('error', 'Unknown error')}")
+        # Create the document and the three primitives in one round trip.
+        # The server runs multicall entries in order, so the document exists
+        # before the objects are added to it.
+        logger.info("Creating document, base cylinder, cutting box and sphere...")
+        multicall = xmlrpc.client.MultiCall(rpc_server)
+        multicall.create_document("ComplexTest")
+        multicall.create_object("ComplexTest", base_cylinder_data)
+        multicall.create_object("ComplexTest", cutting_box_data)
+        multicall.create_object("ComplexTest", sphere_data)
+        doc_result, base_result, cutting_result, sphere_result = multicall()
+        
+        if not doc_result["success"]:
+            logger.error("Failed to create document: %s", doc_result.get('error', 'Unknown error'))
             return False
         
-        logger.info(f"Sphere '{sphere_result['object_name']}' created successfully.")
+        logger.info("Document '%s' created successfully.", doc_result['document_name'])
         
-        # Create a cut operation (cylinder - box)
-        logger.info("Performing cut operation (cylinder - box)...")
+        if not base_result["success"]:
+            logger.error("Failed to create base cylinder: %s", base_result.get('error', 'Unknown error'))
+            return False
         
-        # Use execute_code to perform boolean operations since they're not directly exposed via the RPC API
-        cut_code = """
-import FreeCAD
-doc = FreeCAD.getDocument("ComplexTest")
-cut = doc.addObject("Part::Cut", "CylinderCut")
-cut.Base = doc.BaseCylinder
-cut.Tool = doc.CuttingBox
-cut.ViewObject.ShapeColor = (0.8, 0.5, 0.2, 1.0) # Orange
-doc.recompute()
-        """
+        logger.info("Base cylinder '%s' created successfully.", base_result['object_name'])
         
-        if not execute_freecad_code(rpc_server, cut_code):
+        if not cutting_result["success"]:
+            logger.error("Failed to create cutting box: %s", cutting_result.get('error', 'Unknown error'))
             return False
         
-        logger.info("Cut operation completed successfully.")
+        logger.info("Cutting box '%s' created successfully.", cutting_result['object_name'])
+        
+        if not sphere_result["success"]:
+            logger.error("Failed to create sphere: %s", sphere_result.get('error', 'Unknown error'))
+            return False
         
-        # Create a fusion operation (cut result + sphere)
-        logger.info("Performing fusion operation (cut result + sphere)...")
+        logger.info("Sphere '%s' created successfully.", sphere_result['object_name'])
         
-        fusion_code = """
-import FreeCAD
-doc = FreeCAD.getDocument("ComplexTest")
-fusion = doc.addObject("Part::Fuse", "FinalShape")
-fusion.Base = doc.CylinderCut
-fusion.Tool = doc.AdditiveSphere
-fusion.ViewObject.ShapeColor = (0.8, 0.8, 0.0, 1.0) # Yellow
-doc.recompute()
-        """
+        # Run the cut, fusion, fillet and polar pattern stages in a single execute_code
+        # call. Each stage catches its own exception and the script prints the
+        # failures as JSON, so one failing stage doesn't hide the others.
+        logger.info("Performing cut, fusion, fillet and polar pattern operations...")
         
-        if not execute_freecad_code(rpc_server, fusion_code):
+        # Use execute_code to perform boolean operations since they're not directly exposed via the RPC API
+        result = rpc_server.execute_code(COMPLEX_MODEL_CODE)
+        if not result["success"]:
+            logger.error("Code execution failed: %s", result.get('error', 'Unknown error'))
             return False
         
-        logger.info("Fusion operation completed successfully.")
+        stage_errors = parse_stage_errors(result.get("message", ""))
+        if stage_errors is None:
+            logger.error("Could not read the stage results from the FreeCAD output.")
+            return False
         
-        # Add fillets to the edges (more advanced operation)
-        logger.info("Adding fillets to the final shape...")
+        if "cut" in stage_errors:
+            logger.error("Cut operation failed: %s", stage_errors['cut'])
+            return False
         
-        fillet_code = """
-import FreeCAD
-import Part
-doc = FreeCAD.getDocument("ComplexTest")
-
-# Create a fillet on the final shape
-fillet = doc.addObject("Part::Fillet", "FilletedShape")
-fillet.Base = doc.FinalShape
-
-# Get all edges for filleting
-edges = []
-for i, edge in enumerate(doc.FinalShape.Shape.Edges):
-    edges.append((i+1, 3.0, 3.0))  # (edge_index, radius1, radius2)
-
-fillet.Edges = edges
-doc.recompute()
-
-# Hide original objects
-doc.BaseCylinder.ViewObject.Visibility = False
-doc.CuttingBox.ViewObject.Visibility = False
-doc.AdditiveSphere.ViewObject.Visibility = False
-doc.CylinderCut.ViewObject.Visibility = False
-doc.FinalShape.ViewObject.Visibility = False
-
-# Set the fillet color
-fillet.ViewObject.ShapeColor = (0.9, 0.5, 0.9, 1.0)  # Purple
-        """
+        logger.info("Cut operation completed successfully.")
+        
+        if "fusion" in stage_errors:
+            logger.error("Fusion operation failed: %s", stage_errors['fusion'])
+            return False
         
-        if not execute_freecad_code(rpc_server, fillet_code):
+        logger.info("Fusion operation completed successfully.")
+        
+        if "fillet" in stage_errors:
             # Fillets might fail on complex shapes, but we can continue
-            logger.warning("Fillet operation failed, but continuing with the test.")
+            logger.warning("Fillet operation failed (%s), but continuing with the test.", stage_errors['fillet'])
         else:
             logger.info("Fillet operation completed successfully.")
         
-        # Create a polar pattern (advanced feature)
-        logger.info("Creating a polar pattern of a small cylinder...")
-        
-        pattern_code = """
-import FreeCAD
-import Part
-doc = FreeCAD.getDocument("ComplexTest")
-
-# Create a small cylinder to be patterned
-small_cyl = doc.addObject("Part::Cylinder", "PatternBase")
-small_cyl.Radius = 3.0
-small_cyl.Height = 10.0
-small_cyl.Placement = FreeCAD.Placement(
-    FreeCAD.Vector(40, 0, 0),
-    FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-)
-small_cyl.ViewObject.ShapeColor = (1.0, 0.0, 0.0, 1.0)  # Pure red
-
-doc.recompute()
-
-# Function to create a circular pattern
-def create_circular_pattern(obj, count):
-    shapes = []
-    for i in range(count):
-        angle = i * (360.0 / count)
-        placement = FreeCAD.Placement()
-        placement.Rotation = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), angle)
-        copy = obj.Shape.copy()
-        copy.transformShape(placement.toMatrix())
-        shapes.append(copy)
-    
-    compound = Part.makeCompound(shapes)
-    pattern = doc.addObject("Part::Feature", "PolarPattern")
-    pattern.Shape = compound
-    pattern.ViewObject.ShapeColor = (1.0, 0.0, 0.0, 1.0)  # Pure red
-    return pattern
-
-# Create a pattern with 8 instances
-create_circular_pattern(small_cyl, 8)
-doc.recompute()
-
-# Hide the original
-small_cyl.ViewObject.Visibility = False
-        """
-        
-        if not execute_freecad_code(rpc_server, pattern_code):
+        if "pattern" in stage_errors:
             # Pattern might fail, but we can continue
-            logger.warning("Polar pattern operation failed, but continuing with the test.")
+            logger.warning("Polar pattern operation failed (%s), but continuing with the test.", stage_errors['pattern'])
         else:
             logger.info("Polar pattern created successfully.")
         
-        # List all objects in the document
-        objects = rpc_server.get_objects("ComplexTest")
-        logger.info(f"Objects in document: {[obj['Name'] for obj in objects]}")
-        
-        # Take a screenshot of the final result
-        screenshot = rpc_server.get_active_screenshot("Isometric")
-        if screenshot:
-            logger.info("Screenshot captured successfully.")
+        # List all objects in the document and take a screenshot of the final result.
+        # The object list only feeds the log and the screenshot is a full render, so
+        # each is fetched only when it will be used (set CADDY_TEST_SCREENSHOT=1).
+        log_objects = logger.isEnabledFor(logging.INFO)
+        take_screenshot = os.environ.get("CADDY_TEST_SCREENSHOT") == "1"
+        if log_objects or take_screenshot:
+            multicall = xmlrpc.client.MultiCall(rpc_server)
+            if log_objects:
+                multicall.get_objects("ComplexTest")
+            if take_screenshot:
+                multicall.get_active_screenshot("Isometric")
+            results = iter(multicall())
+            
+            if log_objects:
+                objects = next(results)
+                logger.info("Objects in document: %s", [obj['Name'] for obj in objects])
+            
+            if take_screenshot and next(results):
+                logger.info("Screenshot captured successfully.")
         
         logger.info("Complex model creation complete!")
         return True
     
     except Exception as e:
-        logger.error(f"Error creating complex model: {e}")
+        logger.error("Error creating complex model: %s", e)
         return False
 
 if __name__ == "__main__":
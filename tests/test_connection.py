@@ -4,7 +4,6 @@
 import sys
 import logging
 import xmlrpc.client
-import subprocess
 
 # Configure logging
 logging.basicConfig(
@@ -14,15 +13,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_is_freecad_running():
-    """Check if FreeCAD is running."""
-    try:
-        # Use ps aux to check if FreeCAD is running
-        result = subprocess.run(['ps', 'aux'], stdout=subprocess.PIPE, text=True)
-        return 'freecad' in result.stdout.lower()
-    except Exception as e:
-        logger.error(f"Error checking if FreeCAD is running: {e}")
-        return False
+from _freecad_probe import check_is_freecad_running
+from _rpc_helpers import get_rpc_proxy, probe_rpc_port
 
 def test_freecad_rpc_connection():
     """Test connection to the FreeCAD RPC server on port 9876."""
@@ -33,23 +25,24 @@ def test_freecad_rpc_connection():
     try:
         # Try to connect to the FreeCAD RPC server
         logger.info("Connecting to FreeCAD RPC server on port 9876...")
-        rpc_server = xmlrpc.client.ServerProxy("http://localhost:9876", allow_none=True)
+        probe_rpc_port()
+        rpc_server = get_rpc_proxy()
         
-        # Test the connection with a simple ping
-        result = rpc_server.ping()
+        # Ping and list the documents in a single request
+        multicall = xmlrpc.client.MultiCall(rpc_server)
+        multicall.ping()
+        multicall.list_documents()
+        result, documents = multicall()
         if result:
             logger.info("✅ Successfully connected to FreeCAD RPC server on port 9876")
-            
-            # Get the list of documents
-            documents = rpc_server.list_documents()
-            logger.info(f"FreeCAD documents: {documents}")
+            logger.info("FreeCAD documents: %s", documents)
             
             return True
         else:
             logger.error("Failed to ping FreeCAD RPC server")
             return False
     except Exception as e:
-        logger.error(f"Error connecting to FreeCAD RPC server: {e}")
+        logger.error("Error connecting to FreeCAD RPC server: %s", e)
         logger.info("Make sure the RPC server is started in FreeCAD:")
         logger.info("1. In FreeCAD, select the 'MCP Addon' workbench")
         logger.info("2. Click the 'Start RPC Server' button in the toolbar")
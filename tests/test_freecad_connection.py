@@ -3,8 +3,8 @@
 
 import sys
 import logging
+import socket
 import xmlrpc.client
-import subprocess
 from pathlib import Path
 
 # Configure logging
@@ -15,41 +15,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_is_freecad_running():
-    """Check if FreeCAD is running."""
-    try:
-        # Use ps aux to check if FreeCAD is running
-        result = subprocess.run(['ps', 'aux'], stdout=subprocess.PIPE, text=True)
-        return 'freecad' in result.stdout.lower()
-    except Exception as e:
-        logger.error(f"Error checking if FreeCAD is running: {e}")
-        return False
+from _rpc_helpers import get_rpc_proxy, probe_rpc_port
 
 def test_freecad_rpc_connection():
     """Test connection to the FreeCAD RPC server on port 9876."""
-    if not check_is_freecad_running():
-        logger.warning("FreeCAD is not running. Please start FreeCAD.")
+    # Probe the RPC port directly; this fails fast when FreeCAD is not running
+    try:
+        probe_rpc_port()
+    except OSError:
+        logger.warning("FreeCAD RPC server is not reachable on port 9876. Please start FreeCAD.")
         return False
     
     try:
         # Try to connect to the FreeCAD RPC server
-        rpc_server = xmlrpc.client.ServerProxy("http://localhost:9876", allow_none=True)
+        rpc_server = get_rpc_proxy()
         
-        # Test the connection with a simple ping
-        result = rpc_server.ping()
+        # Ping and list the documents in a single request
+        multicall = xmlrpc.client.MultiCall(rpc_server)
+        multicall.ping()
+        multicall.list_documents()
+        result, documents = multicall()
         if result:
             logger.info("✅ Successfully connected to FreeCAD RPC server on port 9876")
-            
-            # Get the list of documents
-            documents = rpc_server.list_documents()
-            logger.info(f"FreeCAD documents: {documents}")
+            logger.info("FreeCAD documents: %s", documents)
             
             return True
         else:
             logger.error("Failed to ping FreeCAD RPC server")
             return False
     except Exception as e:
-        logger.error(f"Error connecting to FreeCAD RPC server: {e}")
+        logger.error("Error connecting to FreeCAD RPC server: %s", e)
         logger.info("Make sure the RPC server is started in FreeCAD:")
         logger.info("1. In FreeCAD, select the 'MCP Addon' workbench")
         logger.info("2. Click the 'Start RPC Server' button in the toolbar")
@@ -57,8 +52,6 @@ def test_freecad_rpc_connection():
 
 def check_mcp_server_running():
     """Check if the MCP server is running on port 5050."""
-    import socket
-    
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.settimeout(1)
@@ -72,7 +65,7 @@ def check_mcp_server_running():
             logger.warning("❌ MCP server is not running on port 5050")
             return False
     except Exception as e:
-        logger.error(f"Error checking if MCP server is running: {e}")
+        logger.error("Error checking if MCP server is running: %s", e)
         return False
 
 def test_connections():
@@ -3,7 +3,6 @@
 
 import sys
 import logging
-from pathlib import Path
 import importlib
 
 # Configure logging
@@ -14,56 +13,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Add the freecad-mcp submodule to the Python path
-def setup_mcp_environment():
-    """Set up the environment to use FreeCAD MCP."""
-    # Get the project root directory
-    root_dir = Path(__file__).parent
-    mcp_src_dir = root_dir / "freecad-mcp" / "src"
-    
-    if mcp_src_dir.exists():
-        if str(mcp_src_dir) not in sys.path:
-            sys.path.append(str(mcp_src_dir))
-        logger.info(f"Added {mcp_src_dir} to Python path")
-        return True
-    else:
-        logger.error(f"Error: FreeCAD MCP source directory not found at {mcp_src_dir}")
-        return False
-
-def check_is_freecad_running():
-    """Check if FreeCAD is running."""
-    import subprocess
-    try:
-        # Use ps aux instead of pgrep to check if FreeCAD is running
-        result = subprocess.run(['ps', 'aux'], stdout=subprocess.PIPE, text=True)
-        return 'freecad' in result.stdout.lower()
-    except Exception as e:
-        logger.error(f"Error checking if FreeCAD is running: {e}")
-        return False
+from _freecad_probe import check_is_freecad_running
+from _mcp_env import run_async, setup_mcp_environment
 
 def inspect_mcp_module():
-    """Inspect the MCP module to see what's available."""
+    """Inspect the MCP module to see what's available.
+
+    Only runs when debug logging is enabled, since its output is the only result.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return True
+    
     try:
         import mcp
-        logger.info(f"Found MCP package: {mcp.__file__}")
+        logger.debug("Found MCP package: %s", mcp.__file__)
         
         # Inspect the client module
         import mcp.client
-        logger.info(f"MCP client module location: {mcp.client.__file__}")
+        logger.debug("MCP client module location: %s", mcp.client.__file__)
         
         # Print out all the exported names in the module
         client_dir = dir(mcp.client)
-        logger.info(f"Available in mcp.client: {', '.join(client_dir)}")
+        logger.debug("Available in mcp.client: %s", ', '.join(client_dir))
         
         # Inspect the session module
         import mcp.client.session
-        logger.info(f"MCP session module location: {mcp.client.session.__file__}")
+        logger.debug("MCP session module location: %s", mcp.client.session.__file__)
         session_dir = dir(mcp.client.session)
-        logger.info(f"Available in mcp.client.session: {', '.join(session_dir)}")
+        logger.debug("Available in mcp.client.session: %s", ', '.join(session_dir))
         
         return True
     except ImportError as e:
-        logger.error(f"Error importing MCP modules: {e}")
+        logger.error("Error importing MCP modules: %s", e)
         return False
 
 async def test_mcp_connection_async():
@@ -78,11 +59,11 @@ async def test_mcp_connection_async():
             
             # Try to call a method on the server
             response = await session.invoke("ping")
-            logger.info(f"Server response to ping: {response}")
+            logger.info("Server response to ping: %s", response)
             
             return True
     except Exception as e:
-        logger.error(f"Error connecting to FreeCAD MCP server asynchronously: {e}")
+        logger.error("Error connecting to FreeCAD MCP server asynchronously: %s", e)
         return False
 
 def test_mcp_connection():
@@ -105,8 +86,7 @@ def test_mcp_connection():
         logger.info("Successfully imported FreeCAD MCP server module")
         
         # Try the async connection
-        import asyncio
-        connection_result = asyncio.run(test_mcp_connection_async())
+        connection_result = run_async(test_mcp_connection_async())
         
         if connection_result:
             logger.info("Successfully connected to FreeCAD MCP server")
@@ -115,10 +95,10 @@ def test_mcp_connection():
             logger.error("Failed to connect to FreeCAD MCP server asynchronously")
             return False
     except ImportError as e:
-        logger.error(f"Error importing modules: {e}")
+        logger.error("Error importing modules: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Error connecting to FreeCAD MCP server: {e}")
+        logger.error("Error connecting to FreeCAD MCP server: %s", e)
         logger.info("Make sure FreeCAD is running with the MCP server enabled.")
         logger.info("1. Open FreeCAD")
         logger.info("2. Go to Edit > Preferences > General > Mission Control")
@@ -5,7 +5,6 @@ import sys
 import logging
 import time
 import xmlrpc.client
-import subprocess
 from pathlib import Path
 
 # Configure logging
@@ -16,56 +15,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_is_freecad_running():
-    """Check if FreeCAD is running."""
-    try:
-        # Use ps aux to check if FreeCAD is running
-        result = subprocess.run(['ps', 'aux'], stdout=subprocess.PIPE, text=True)
-        return 'freecad' in result.stdout.lower()
-    except Exception as e:
-        logger.error(f"Error checking if FreeCAD is running: {e}")
-        return False
-
-def test_freecad_rpc_connection():
-    """Test connection to the FreeCAD RPC server on port 9876."""
-    if not check_is_freecad_running():
-        logger.warning("FreeCAD is not running. Please start FreeCAD.")
-        return False
-    
-    try:
-        # Try to connect to the FreeCAD RPC server
-        logger.info("Connecting to FreeCAD RPC server on port 9876...")
-        rpc_server = xmlrpc.client.ServerProxy("http://localhost:9876", allow_none=True)
-        
-        # Test the connection with a simple ping
-        result = rpc_server.ping()
-        if result:
-            logger.info("✅ Successfully connected to FreeCAD RPC server on port 9876")
-            return rpc_server
-        else:
-            logger.error("Failed to ping FreeCAD RPC server")
-            return None
-    except Exception as e:
-        logger.error(f"Error connecting to FreeCAD RPC server: {e}")
-        logger.info("Make sure the RPC server is started in FreeCAD:")
-        logger.info("1. In FreeCAD, select the 'MCP Addon' workbench")
-        logger.info("2. Click the 'Start RPC Server' button in the toolbar")
-        return None
+from _rpc_helpers import test_freecad_rpc_connection
 
 def create_simple_model(rpc_server):
     """Create a simple model in FreeCAD."""
     try:
-        # Create a new document
-        logger.info("Creating a new document...")
-        doc_result = rpc_server.create_document("SimpleTest")
-        if not doc_result["success"]:
-            logger.error(f"Failed to create document: {doc_result.get('error', 'Unknown error')}")
-            return False
-        
-        logger.info(f"Document '{doc_result['document_name']}' created successfully.")
-        
-        # Create a box
-        logger.info("Creating a box...")
+        # Box
         box_data = {
             "Name": "SimpleBox",
             "Type": "Part::Box",
@@ -80,15 +35,7 @@ def create_simple_model(rpc_server):
             }
         }
         
-        box_result = rpc_server.create_object("SimpleTest", box_data)
-        if not box_result["success"]:
-            logger.error(f"Failed to create box: {box_result.get('error', 'Unknown error')}")
-            return False
-        
-        logger.info(f"Box '{box_result['object_name']}' created successfully.")
-        
-        # Create a cylinder
-        logger.info("Creating a cylinder...")
+        # Cylinder
         cylinder_data = {
             "Name": "SimpleCylinder",
             "Type": "Part::Cylinder",
@@ -102,22 +49,41 @@ def create_simple_model(rpc_server):
             }
         }
         
-        cylinder_result = rpc_server.create_object("SimpleTest", cylinder_data)
+        # Create the document and both objects, then list the objects, in one
+        # round trip. The server runs multicall entries in order.
+        logger.info("Creating a new document with a box and a cylinder...")
+        multicall = xmlrpc.client.MultiCall(rpc_server)
+        multicall.create_document("SimpleTest")
+        multicall.create_object("SimpleTest", box_data)
+        multicall.create_object("SimpleTest", cylinder_data)
+        multicall.get_objects("SimpleTest")
+        doc_result, box_result, cylinder_result, objects = multicall()
+        
+        if not doc_result["success"]:
+            logger.error("Failed to create document: %s", doc_result.get('error', 'Unknown error'))
+            return False
+        
+        logger.info("Document '%s' created successfully.", doc_result['document_name'])
+        
+        if not box_result["success"]:
+            logger.error("Failed to create box: %s", box_result.get('error', 'Unknown error'))
+            return False
+        
+        logger.info("Box '%s' created successfully.", box_result['object_name'])
+        
         if not cylinder_result["success"]:
-            logger.error(f"Failed to create cylinder: {cylinder_result.get('error', 'Unknown error')}")
+            logger.error("Failed to create cylinder: %s", cylinder_result.get('error', 'Unknown error'))
             return False
         
-        logger.info(f"Cylinder '{cylinder_result['object_name']}' created successfully.")
+        logger.info("Cylinder '%s' created successfully.", cylinder_result['object_name'])
         
-        # List all objects in the document
-        objects = rpc_server.get_objects("SimpleTest")
-        logger.info(f"Objects in document: {[obj['Name'] for obj in objects]}")
+        logger.info("Objects in document: %s", [obj['Name'] for obj in objects])
         
         logger.info("Simple model creation complete!")
         return True
     
     except Exception as e:
-        logger.error(f"Error creating model: {e}")
+        logger.error("Error creating model: %s", e)
         return False
 
 if __name__ == "__main__":
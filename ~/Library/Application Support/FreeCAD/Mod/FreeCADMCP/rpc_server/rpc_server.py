@@ -7,11 +7,13 @@ import queue
 import base64
 import io
 import os
+import socket
 import tempfile
 import threading
 from dataclasses import dataclass, field
+from socketserver import ThreadingMixIn
 from typing import Any
-from xmlrpc.server import SimpleXMLRPCServer
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 
 from PySide2.QtCore import QTimer
 
@@ -24,6 +26,50 @@ rpc_server_instance = None
 # GUI task queue
 rpc_request_queue = queue.Queue()
 rpc_response_queue = queue.Queue()
+# Serializes GUI round-trips so each RPC thread reads back its own response
+rpc_gui_lock = threading.Lock()
+
+
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    # Keep the connection open between requests from the same client
+    protocol_version = "HTTP/1.1"
+
+
+class ThreadedXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    # One thread per connection so an idle keep-alive client cannot block others
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Open client connections, so stopping the server can drop keep-alive clients
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        # Registered before the handler thread starts, so close_connections() sees
+        # every connection accepted before serve_forever() returned
+        with self._connections_lock:
+            self._connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def close_connections(self):
+        """Shut down every open client connection.
+
+        The handler threads then read EOF, finish their keep-alive loop and
+        close their sockets.
+        """
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
 
 def process_gui_tasks():
@@ -35,6 +81,12 @@ def process_gui_tasks():
     QTimer.singleShot(500, process_gui_tasks)
 
 
+def run_gui_task(task):
+    with rpc_gui_lock:
+        rpc_request_queue.put(task)
+        return rpc_response_queue.get()
+
+
 @dataclass
 class Object:
     name: str
@@ -128,8 +180,7 @@ class FreeCADRPC:
         return True
 
     def create_document(self, name="New_Document"):
-        rpc_request_queue.put(lambda: self._create_document_gui(name))
-        res = rpc_response_queue.get()
+        res = run_gui_task(lambda: self._create_document_gui(name))
         if res is True:
             return {"success": True, "document_name": name}
         else:
@@ -142,8 +193,7 @@ class FreeCADRPC:
             analysis=obj_data.get("Analysis", None),
             properties=obj_data.get("Properties", {}),
         )
-        rpc_request_queue.put(lambda: self._create_object_gui(doc_name, obj))
-        res = rpc_response_queue.get()
+        res = run_gui_task(lambda: self._create_object_gui(doc_name, obj))
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
@@ -154,16 +204,14 @@ class FreeCADRPC:
             name=obj_name,
             properties=properties.get("Properties", {}),
         )
-        rpc_request_queue.put(lambda: self._edit_object_gui(doc_name, obj))
-        res = rpc_response_queue.get()
+        res = run_gui_task(lambda: self._edit_object_gui(doc_name, obj))
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
             return {"success": False, "error": res}
 
     def delete_object(self, doc_name: str, obj_name: str):
-        rpc_request_queue.put(lambda: self._delete_object_gui(doc_name, obj_name))
-        res = rpc_response_queue.get()
+        res = run_gui_task(lambda: self._delete_object_gui(doc_name, obj_name))
         if res is True:
             return {"success": True, "object_name": obj_name}
         else:
@@ -183,8 +231,7 @@ class FreeCADRPC:
                 )
                 return f"Error executing Python code: {e}\n"
 
-        rpc_request_queue.put(task)
-        res = rpc_response_queue.get()
+        res = run_gui_task(task)
         if res is True:
             return {
                 "success": True,
@@ -193,38 +240,44 @@ class FreeCADRPC:
         else:
             return {"success": False, "error": res}
 
+    # The read-only methods below run on the handler thread, as they did on the
+    # single-threaded server; rpc_gui_lock keeps them from overlapping a GUI task
+    # that is changing the documents they read.
+
     def get_objects(self, doc_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            return [serialize_object(obj) for obj in doc.Objects]
-        else:
-            return []
+        with rpc_gui_lock:
+            doc = FreeCAD.getDocument(doc_name)
+            if doc:
+                return [serialize_object(obj) for obj in doc.Objects]
+            else:
+                return []
 
     def get_object(self, doc_name, obj_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            return serialize_object(doc.getObject(obj_name))
-        else:
-            return None
+        with rpc_gui_lock:
+            doc = FreeCAD.getDocument(doc_name)
+            if doc:
+                return serialize_object(doc.getObject(obj_name))
+            else:
+                return None
 
     def insert_part_from_library(self, relative_path):
-        rpc_request_queue.put(lambda: self._insert_part_from_library(relative_path))
-        res = rpc_response_queue.get()
+        res = run_gui_task(lambda: self._insert_part_from_library(relative_path))
         if res is True:
             return {"success": True, "message": "Part inserted from library."}
         else:
             return {"success": False, "error": res}
 
     def list_documents(self):
-        return list(FreeCAD.listDocuments().keys())
+        with rpc_gui_lock:
+            return list(FreeCAD.listDocuments().keys())
 
     def get_parts_list(self):
-        return get_parts_list()
+        with rpc_gui_lock:
+            return get_parts_list()
 
     def get_active_screenshot(self, view_name: str = "Isometric") -> str:
         temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-        rpc_request_queue.put(lambda: self._save_active_screenshot(temp_file.name, view_name))
-        res = rpc_response_queue.get()
+        res = run_gui_task(lambda: self._save_active_screenshot(temp_file.name, view_name))
         if res is True:
             with open(temp_file.name, "rb") as image_file:
                 image_bytes = image_file.read()
@@ -396,11 +449,15 @@ def start_rpc_server(host="localhost", port=9876):
 
     try:
         FreeCAD.Console.PrintMessage(f"Creating XML-RPC server on {host}:{port}...\n")
-        rpc_server_instance = SimpleXMLRPCServer(
-            (host, port), allow_none=True, logRequests=False
+        rpc_server_instance = ThreadedXMLRPCServer(
+            (host, port),
+            requestHandler=KeepAliveRequestHandler,
+            allow_none=True,
+            logRequests=False,
         )
         FreeCAD.Console.PrintMessage("Registering RPC instance...\n")
         rpc_server_instance.register_instance(FreeCADRPC())
+        rpc_server_instance.register_multicall_functions()
 
         def server_loop():
             FreeCAD.Console.PrintMessage(f"RPC Server thread started at {host}:{port}\n")
@@ -427,6 +484,11 @@ def stop_rpc_server():
         try:
             FreeCAD.Console.PrintMessage("Calling server shutdown()...\\n")
             rpc_server_instance.shutdown()
+            # shutdown() only stops accepting; drop the keep-alive clients and
+            # release the listening socket too
+            FreeCAD.Console.PrintMessage("Closing client connections...\\n")
+            rpc_server_instance.close_connections()
+            rpc_server_instance.server_close()
             FreeCAD.Console.PrintMessage("Joining server thread...\\n")
             rpc_server_thread.join(timeout=2.0)
             if rpc_server_thread.is_alive():
@@ -480,7 +542,7 @@ class StopRPCServerCommand:
             msg = stop_rpc_server()
             FreeCAD.Console.PrintMessage(f"stop_rpc_server returned: {msg}\\n")
         except Exception as e:
-             error_msg = f"!!! EXCEPTION calling stop_rpc_server: {str(e)}\\n"
+            error_msg = f"!!! EXCEPTION calling stop_rpc_server: {str(e)}\\n"
             FreeCAD.Console.PrintError(error_msg)
             print(error_msg)
 